@@ -1,16 +1,46 @@
+# Stan aut trzymany w tablicach zamiast w napisach na każdym obiekcie.
+# Car jest widokiem na jedno miejsce w magazynie, a napisy powstają
+# dopiero przy odczycie
+class CarStore:
+    def __init__(self, size=0):
+        self.engine_running = bytearray(size)  # 1 = uruchomiony
+        self.wheels_rotating = bytearray(size)  # 1 = obracają się
+
+    def __len__(self):
+        return len(self.engine_running)
+
+    def add(self):
+        self.engine_running.append(0)
+        self.wheels_rotating.append(0)
+        return len(self.engine_running) - 1
+
+
 class Car:
-    def __init__(self):
-        self.engine_status = "Zatrzymany"
-        self.wheels_status = "Nie obracają się"
+    def __init__(self, store=None, index=None):
+        # Bez magazynu auto dostaje własny, jednoelementowy
+        if store is None:
+            store = CarStore()
+        if index is None:
+            index = store.add()
+        self.store = store
+        self.index = index
+
+    @property
+    def engine_status(self):
+        return "Uruchomiony" if self.store.engine_running[self.index] else "Zatrzymany"
+
+    @property
+    def wheels_status(self):
+        return "Obracają się" if self.store.wheels_rotating[self.index] else "Nie obracają się"
 
     def start(self):
-        self.engine_status = "Uruchomiony"
-        self.wheels_status = "Obracają się"
+        self.store.engine_running[self.index] = 1
+        self.store.wheels_rotating[self.index] = 1
         return f"Silnik {self.engine_status}, Koła {self.wheels_status}"
 
     def stop(self):
-        self.engine_status = "Zatrzymany"
-        self.wheels_status = "Nie obracają się"
+        self.store.engine_running[self.index] = 0
+        self.store.wheels_rotating[self.index] = 0
         return f"Silnik {self.engine_status}"
 
 
@@ -1,27 +1,95 @@
+import argparse
+import heapq
+import random
+import time
+from array import array
+
+
+# Stan wszystkich samochodów trzymany w tablicach, po jednym miejscu na auto.
+# Engine, Wheels i Car są tylko widokami na jedno miejsce w magazynie
+class FleetStore:
+    def __init__(self, size=0):
+        self.engine_running = bytearray(size)  # 1 = silnik uruchomiony
+        self.wheels_rotating = bytearray(size)  # 1 = koła się obracają
+        self.gear = bytearray(size)  # 0 = luz
+        self.trip_end = array('q', bytes(8 * size))  # koniec jazdy w ms, gdy auto jedzie
+
+    def __len__(self):
+        return len(self.gear)
+
+    def add(self):
+        # Miejsce dla nowego auta, zwraca jego numer
+        self.engine_running.append(0)
+        self.wheels_rotating.append(0)
+        self.gear.append(0)
+        self.trip_end.append(0)
+        return len(self.gear) - 1
+
+
 class Engine:
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def running(self):
+        return bool(self.store.engine_running[self.index])
+
     def start(self):
+        self.store.engine_running[self.index] = 1
         return "Silnik uruchomiony"
 
     def stop(self):
+        self.store.engine_running[self.index] = 0
         return "Silnik zatrzymany"
 
 
 class Wheels:
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def rotating(self):
+        return bool(self.store.wheels_rotating[self.index])
+
     def rotate(self):
+        self.store.wheels_rotating[self.index] = 1
         return "Koła się obracają"
 
+    def halt(self):
+        self.store.wheels_rotating[self.index] = 0
+        return "Koła się zatrzymały"
+
 
 class Car:
-    def __init__(self):
-        self.engine = Engine()
-        self.wheels = Wheels()
+    def __init__(self, store=None, index=None):
+        # Bez magazynu auto dostaje własny, jednoelementowy
+        if store is None:
+            store = FleetStore()
+        if index is None:
+            index = store.add()
+        self.store = store
+        self.index = index
+        self.engine = Engine(store, index)
+        self.wheels = Wheels(store, index)
+
+    @property
+    def gear(self):
+        return self.store.gear[self.index]
 
     def start(self):
         engine_status = self.engine.start()
         wheels_status = self.wheels.rotate()
         return f"{engine_status}, {wheels_status}"
 
+    def shift(self, gear):
+        self.store.gear[self.index] = gear
+        return f"Bieg {gear}"
+
     def stop(self):
+        self.wheels.halt()
+        self.store.gear[self.index] = 0
         return self.engine.stop()
 
 
@@ -32,13 +100,134 @@ class Driver:
         print(car.stop())
 
 
+# Rodzaje zdarzeń w symulacji floty
+START, SHIFT, STOP = 0, 1, 2
+EVENT_NAMES = ["start", "zmiana biegu", "stop"]
+
+TOP_GEAR = 5
+MEAN_TRIP = 600.0  # średni czas jazdy, w sekundach symulacji
+MEAN_PARKING = 1800.0  # średni postój między jazdami
+MEAN_SHIFT = 20.0  # średni czas między zmianami biegu
+FIRST_START_WINDOW = 60.0  # pierwsze starty rozłożone na tę liczbę sekund
+
+# Zdarzenie w kolejce to jedna liczba: czas w milisekundach, numer auta i
+# rodzaj zdarzenia upakowane w bitach. Kopiec liczb jest szybszy niż kopiec
+# krotek, a porządek ten sam: najpierw czas, potem numer auta
+CAR_BITS = 22  # do ok. 4 mln aut
+KIND_BITS = 2
+TIME_SHIFT = CAR_BITS + KIND_BITS
+CAR_MASK = (1 << CAR_BITS) - 1
+KIND_MASK = (1 << KIND_BITS) - 1
+MS = 1000.0
+
+
+def event_key(time_ms, car, kind):
+    return (time_ms << TIME_SHIFT) | (car << KIND_BITS) | kind
+
+
+# Symulacja floty sterowana zdarzeniami, z kolejką zdarzeń na kopcu. Każde
+# auto ma w kolejce dokładnie jedno zdarzenie: obsłużenie go planuje następne
+class FleetSimulator:
+    def __init__(self, cars, seed=0):
+        if cars > CAR_MASK + 1:
+            raise ValueError(f"Najwyżej {CAR_MASK + 1} aut")
+        self.store = FleetStore(cars)
+        self.rng = random.Random(seed)
+        self.now = 0.0
+        self.counts = [0, 0, 0]  # zdarzenia według rodzaju
+        uniform = self.rng.uniform
+        self.queue = [event_key(int(uniform(0.0, FIRST_START_WINDOW) * MS), car, START) for car in range(cars)]
+        heapq.heapify(self.queue)
+
+    def car(self, index):
+        # Widok na jedno auto floty
+        return Car(self.store, index)
+
+    def run(self, until):
+        # Obsługuje zdarzenia do chwili `until` (w sekundach), zwraca ich
+        # liczbę. Następne zdarzenie auta od razu zastępuje obsłużone na
+        # szczycie kopca
+        queue = self.queue
+        heapreplace = heapq.heapreplace
+        expovariate = self.rng.expovariate
+        chance = self.rng.random
+        engine_running = self.store.engine_running
+        wheels_rotating = self.store.wheels_rotating
+        gear = self.store.gear
+        trip_end = self.store.trip_end
+        counts = self.counts
+        trip_rate = 1 / MEAN_TRIP
+        parking_rate = 1 / MEAN_PARKING
+        shift_rate = 1 / MEAN_SHIFT
+        last = event_key(int(until * MS), CAR_MASK, KIND_MASK)
+        handled = 0
+        while queue and queue[0] <= last:
+            key = queue[0]
+            now = key >> TIME_SHIFT
+            car = (key >> KIND_BITS) & CAR_MASK
+            kind = key & KIND_MASK
+            counts[kind] += 1
+            handled += 1
+            if kind == STOP:
+                engine_running[car] = 0
+                wheels_rotating[car] = 0
+                gear[car] = 0
+                start_at = now + int(expovariate(parking_rate) * MS)
+                heapreplace(queue, (start_at << TIME_SHIFT) | (car << KIND_BITS) | START)
+                continue
+            if kind == START:
+                engine_running[car] = 1
+                wheels_rotating[car] = 1
+                gear[car] = 1
+                trip_end[car] = now + int(expovariate(trip_rate) * MS)
+            else:
+                current = gear[car]
+                if current == TOP_GEAR or (current > 1 and chance() < 0.5):
+                    gear[car] = current - 1
+                else:
+                    gear[car] = current + 1
+            shift_at = now + int(expovariate(shift_rate) * MS)
+            if shift_at < trip_end[car]:
+                heapreplace(queue, (shift_at << TIME_SHIFT) | (car << KIND_BITS) | SHIFT)
+            else:
+                heapreplace(queue, (trip_end[car] << TIME_SHIFT) | (car << KIND_BITS) | STOP)
+        self.now = until
+        return handled
+
+    def running(self):
+        return sum(self.store.engine_running)
+
+
+def simulate_fleet(cars, hours, seed=0):
+    simulator = FleetSimulator(cars, seed)
+    started = time.perf_counter()
+    handled = simulator.run(hours * 3600.0)
+    seconds = time.perf_counter() - started
+    print(f"Flota: {cars} aut, {hours} h symulacji")
+    for name, count in zip(EVENT_NAMES, simulator.counts):
+        print(f"  {name}: {count}")
+    print(f"Zdarzenia: {handled} w {seconds:.2f} s, {handled / seconds:,.0f} zdarzeń na sekundę")
+    print(f"W trasie na koniec: {simulator.running()} aut")
+    return simulator
+
+
 # Główna część programu
 if __name__ == "__main__":
-    my_car = Car()
-    driver = Driver()
-    driver.drive(my_car)
-
-    # Dodatkowe operacje
-    for _ in range(5):
-        print("Zmieniam bieg...")
-    print("Zatrzymujemy się na światłach.")
+    parser = argparse.ArgumentParser(description="Samochód złożony z silnika i kół, albo symulacja całej floty.")
+    parser.add_argument('mode', nargs='?', choices=['fleet'], help="fleet: symulacja floty")
+    parser.add_argument('--cars', type=int, default=100000)
+    parser.add_argument('--hours', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.mode == 'fleet':
+        simulate_fleet(args.cars, args.hours, args.seed)
+    else:
+        my_car = Car()
+        driver = Driver()
+        driver.drive(my_car)
+
+        # Dodatkowe operacje
+        for _ in range(5):
+            print("Zmieniam bieg...")
+        print("Zatrzymujemy się na światłach.")